@@ -4,13 +4,39 @@ Each validator implements format validation and live key testing
 """
 
 import re
+import string
+import threading
+import orjson
 import requests
 from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+import config
+from known_invalid import known_invalid
 
 
 class BaseValidator(ABC):
     """Base class for all API validators"""
 
+    # Provider name, used to look up per-provider settings in config
+    API_NAME = None
+
+    # Headers that are the same for every key, set once on the session
+    SESSION_HEADERS = {"Accept": "application/json"}
+
+    # Statuses a HEAD probe can answer conclusively; anything else is re-checked with GET
+    HEAD_CONCLUSIVE_STATUSES = (200, 401)
+
+    def __init__(self):
+        # Fail fast on connect; the read budget is tuned per provider
+        read_timeout = config.API_TIMEOUTS.get(self.API_NAME, config.API_TIMEOUT)
+        self._timeout = (config.API_CONNECT_TIMEOUT, read_timeout)
+
+        # Persistent session so repeated checks reuse pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+        self._session.headers["Connection"] = "keep-alive"
+        self._session.headers.update(self.SESSION_HEADERS)
+
     @abstractmethod
     def validate_format(self, key):
         """Check if key format is valid"""
@@ -21,27 +47,40 @@ class BaseValidator(ABC):
         """Test if key is active, returns (is_active: bool, error: str)"""
         pass
 
+    def _unauthorized(self, key, message):
+        """Remember a key the provider rejected with 401 and return the failure"""
+        known_invalid.add(self.API_NAME, key)
+        return False, message
+
+    def _head_or_get(self, url, **kwargs):
+        """HEAD the URL, falling back to GET unless HEAD gave a conclusive answer"""
+        response = self._session.head(url, allow_redirects=True, **kwargs)
+        if response.status_code not in self.HEAD_CONCLUSIVE_STATUSES:
+            response = self._session.get(url, **kwargs)
+        return response
+
 
 class OpenAIValidator(BaseValidator):
     """Validator for OpenAI API keys"""
 
-    FORMAT_PATTERN = r"^sk-[A-Za-z0-9\-]{20,}$"
+    API_NAME = "openai"
+    FORMAT_REGEX = re.compile(r"^sk-[A-Za-z0-9\-]{20,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.get(
+            response = self._head_or_get(
                 "https://api.openai.com/v1/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid key"
+                return self._unauthorized(key, "Unauthorized - invalid key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -51,23 +90,24 @@ class OpenAIValidator(BaseValidator):
 class GitHubValidator(BaseValidator):
     """Validator for GitHub Personal Access Tokens"""
 
-    FORMAT_PATTERN = r"^(ghp_|github_pat_)[A-Za-z0-9_]{36,}$"
+    API_NAME = "github"
+    FORMAT_REGEX = re.compile(r"^(ghp_|github_pat_)[A-Za-z0-9_]{36,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"token {key}"}
-            response = requests.get(
+            response = self._session.get(
                 "https://api.github.com/user",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid token"
+                return self._unauthorized(key, "Unauthorized - invalid token")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -77,51 +117,84 @@ class GitHubValidator(BaseValidator):
 class GoogleValidator(BaseValidator):
     """Validator for Google API keys"""
 
-    FORMAT_PATTERN = r"^AIza[0-9A-Za-z\-_]{35}$"
+    API_NAME = "google"
+    FORMAT_REGEX = re.compile(r"^AIza[0-9A-Za-z\-_]{35}$")
+    _CHARSET_DEL = str.maketrans("", "", string.digits + string.ascii_letters + "-_")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return len(key) == 39 and key.startswith("AIza") and key[4:].translate(self._CHARSET_DEL) == ""
 
     def test_key(self, key):
         try:
             # Test with Google Geocoding API (free tier)
-            response = requests.get(
+            response = self._session.get(
                 "https://maps.googleapis.com/maps/api/geocode/json",
                 params={"address": "1600 Amphitheatre Parkway, Mountain View, CA", "key": key},
-                timeout=5,
+                timeout=self._timeout,
             )
-            data = response.json()
+            if response.status_code != 200:
+                return False, f"HTTP {response.status_code}"
 
-            if response.status_code == 200:
-                if "error_message" not in data:
-                    return True, None
-                else:
-                    return False, data.get("error_message", "API returned error")
+            # Successful responses never contain error_message, so skip parsing them
+            raw = response.content
+            if b'"error_message"' not in raw:
+                return True, None
+
+            data = orjson.loads(raw)
+            if "error_message" not in data:
+                return True, None
             else:
-                return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
+                return False, data.get("error_message", "API returned error")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             return False, str(e)
 
 
 class AWSValidator(BaseValidator):
     """Validator for AWS Access Keys"""
 
-    FORMAT_PATTERN = r"^AKIA[0-9A-Z]{16}$"
+    API_NAME = "aws"
+    FORMAT_REGEX = re.compile(r"^AKIA[0-9A-Z]{16}$")
+    _CHARSET_DEL = str.maketrans("", "", string.digits + string.ascii_uppercase)
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return len(key) == 20 and key.startswith("AKIA") and key[4:].translate(self._CHARSET_DEL) == ""
+
+    def __init__(self):
+        super().__init__()
+        # boto3 is slow to import, so the session is only built on the first check
+        self._boto_session = None
+        self._boto_config = None
+        # boto3 sessions are not thread-safe; the clients they create are
+        self._boto_lock = threading.Lock()
+
+    def _sts_client(self, key):
+        """Create an STS client for key, importing boto3 on first use"""
+        with self._boto_lock:
+            if self._boto_session is None:
+                import boto3
+                from botocore.config import Config
+
+                # Single attempt: botocore's default retries make invalid keys take several seconds
+                self._boto_config = Config(
+                    connect_timeout=self._timeout[0],
+                    read_timeout=self._timeout[1],
+                    retries={"total_max_attempts": 1, "mode": "standard"},
+                )
+                self._boto_session = boto3.session.Session()
+            return self._boto_session.client("sts", aws_access_key_id=key, config=self._boto_config)
 
     def test_key(self, key):
         try:
             # AWS keys need both access key and secret key
             # For format validation only without secret key
-            import boto3
 
             # Create STS client with the key
             # Note: This requires AWS_SECRET_ACCESS_KEY environment variable or credentials file
-            sts = boto3.client("sts", aws_access_key_id=key)
+            sts = self._sts_client(key)
             sts.get_caller_identity()
             return True, None
+        except ImportError:  # boto3 is only needed for AWS keys
+            return False, "boto3 is not installed"
         except Exception as e:
             error_msg = str(e)
             if "InvalidClientTokenId" in error_msg or "SignatureDoesNotMatch" in error_msg:
@@ -135,23 +208,24 @@ class AWSValidator(BaseValidator):
 class HuggingFaceValidator(BaseValidator):
     """Validator for Hugging Face API tokens"""
 
-    FORMAT_PATTERN = r"^hf_[A-Za-z0-9_]{34,}$"
+    API_NAME = "huggingface"
+    FORMAT_REGEX = re.compile(r"^hf_[A-Za-z0-9_]{34,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.get(
+            response = self._head_or_get(
                 "https://huggingface.co/api/whoami",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid token"
+                return self._unauthorized(key, "Unauthorized - invalid token")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -161,26 +235,28 @@ class HuggingFaceValidator(BaseValidator):
 class ClaudeValidator(BaseValidator):
     """Validator for Claude (Anthropic) API keys"""
 
-    FORMAT_PATTERN = r"^sk-ant-[A-Za-z0-9\-_]{70,}$"
+    API_NAME = "claude"
+    SESSION_HEADERS = {
+        "Accept": "application/json",
+        "anthropic-version": "2023-06-01",
+    }
+    FORMAT_REGEX = re.compile(r"^sk-ant-[A-Za-z0-9\-_]{70,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
-            headers = {
-                "x-api-key": key,
-                "anthropic-version": "2023-06-01",
-            }
-            response = requests.get(
+            headers = {"x-api-key": key}
+            response = self._session.get(
                 "https://api.anthropic.com/v1/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -190,17 +266,18 @@ class ClaudeValidator(BaseValidator):
 class GeminiValidator(BaseValidator):
     """Validator for Google Gemini API keys"""
 
-    FORMAT_PATTERN = r"^AIza[0-9A-Za-z\-_]{35}$|^[A-Za-z0-9_\-]{40,}$"
+    API_NAME = "gemini"
+    FORMAT_REGEX = re.compile(r"^AIza[0-9A-Za-z\-_]{35}$|^[A-Za-z0-9_\-]{40,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
-            response = requests.get(
+            response = self._session.get(
                 "https://generativelanguage.googleapis.com/v1beta/models",
                 params={"key": key},
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
@@ -217,23 +294,24 @@ class GeminiValidator(BaseValidator):
 class GrokValidator(BaseValidator):
     """Validator for Grok (xAI) API keys"""
 
-    FORMAT_PATTERN = r"^xai-[A-Za-z0-9\-_]{20,}$"
+    API_NAME = "grok"
+    FORMAT_REGEX = re.compile(r"^xai-[A-Za-z0-9\-_]{20,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.get(
+            response = self._head_or_get(
                 "https://api.x.ai/v1/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -243,23 +321,25 @@ class GrokValidator(BaseValidator):
 class CohereValidator(BaseValidator):
     """Validator for Cohere API keys"""
 
-    FORMAT_PATTERN = r"^[a-z0-9\-]{36}$"
+    API_NAME = "cohere"
+    FORMAT_REGEX = re.compile(r"^[a-z0-9\-]{36}$")
+    _CHARSET_DEL = str.maketrans("", "", string.digits + string.ascii_lowercase + "-")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return len(key) == 36 and key.translate(self._CHARSET_DEL) == ""
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.post(
+            response = self._session.post(
                 "https://api.cohere.com/v1/check-api-key",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -269,23 +349,24 @@ class CohereValidator(BaseValidator):
 class PerplexityValidator(BaseValidator):
     """Validator for Perplexity API keys"""
 
-    FORMAT_PATTERN = r"^pplx-[A-Za-z0-9\-_]{40,}$"
+    API_NAME = "perplexity"
+    FORMAT_REGEX = re.compile(r"^pplx-[A-Za-z0-9\-_]{40,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.get(
+            response = self._head_or_get(
                 "https://api.perplexity.ai/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -295,23 +376,25 @@ class PerplexityValidator(BaseValidator):
 class ReplicateValidator(BaseValidator):
     """Validator for Replicate API tokens"""
 
-    FORMAT_PATTERN = r"^[a-z0-9]{40}$"
+    API_NAME = "replicate"
+    FORMAT_REGEX = re.compile(r"^[a-z0-9]{40}$")
+    _CHARSET_DEL = str.maketrans("", "", string.digits + string.ascii_lowercase)
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return len(key) == 40 and key.translate(self._CHARSET_DEL) == ""
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Token {key}"}
-            response = requests.get(
+            response = self._session.get(
                 "https://api.replicate.com/v1/account",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid token"
+                return self._unauthorized(key, "Unauthorized - invalid token")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -321,23 +404,25 @@ class ReplicateValidator(BaseValidator):
 class TogetherAIValidator(BaseValidator):
     """Validator for Together AI API keys"""
 
-    FORMAT_PATTERN = r"^[a-z0-9]{40}$"
+    API_NAME = "togetherai"
+    FORMAT_REGEX = re.compile(r"^[a-z0-9]{40}$")
+    _CHARSET_DEL = str.maketrans("", "", string.digits + string.ascii_lowercase)
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return len(key) == 40 and key.translate(self._CHARSET_DEL) == ""
 
     def test_key(self, key):
         try:
             headers = {"Authorization": f"Bearer {key}"}
-            response = requests.get(
+            response = self._head_or_get(
                 "https://api.together.xyz/v1/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
@@ -347,27 +432,60 @@ class TogetherAIValidator(BaseValidator):
 class AnthropicValidator(BaseValidator):
     """Validator for Anthropic API keys (alternative format)"""
 
-    FORMAT_PATTERN = r"^sk-ant-[A-Za-z0-9\-_]{60,}$"
+    API_NAME = "anthropic"
+    SESSION_HEADERS = {
+        "Accept": "application/json",
+        "anthropic-version": "2023-06-01",
+    }
+    FORMAT_REGEX = re.compile(r"^sk-ant-[A-Za-z0-9\-_]{60,}$")
 
     def validate_format(self, key):
-        return bool(re.match(self.FORMAT_PATTERN, key))
+        return self.FORMAT_REGEX.match(key) is not None
 
     def test_key(self, key):
         try:
-            headers = {
-                "x-api-key": key,
-                "anthropic-version": "2023-06-01",
-            }
-            response = requests.get(
+            headers = {"x-api-key": key}
+            response = self._session.get(
                 "https://api.anthropic.com/v1/models",
                 headers=headers,
-                timeout=5,
+                timeout=self._timeout,
             )
             if response.status_code == 200:
                 return True, None
             elif response.status_code == 401:
-                return False, "Unauthorized - invalid API key"
+                return self._unauthorized(key, "Unauthorized - invalid API key")
             else:
                 return False, f"HTTP {response.status_code}"
         except requests.RequestException as e:
             return False, str(e)
+
+
+# Providers recognised by detect_provider, most specific formats first.
+# Some formats are identical, so detection always picks the first listed provider:
+# - TogetherAI keys share Replicate's format exactly and are detected as "replicate"
+# - Gemini keys with the AIza prefix share Google's format and are detected as "google";
+#   only Gemini's other (40+ character) format is ever detected as "gemini"
+DETECTION_ORDER = (
+    ClaudeValidator,
+    GitHubValidator,
+    HuggingFaceValidator,
+    GrokValidator,
+    PerplexityValidator,
+    AWSValidator,
+    GoogleValidator,
+    OpenAIValidator,
+    CohereValidator,
+    ReplicateValidator,
+    GeminiValidator,
+)
+
+# Every format in one alternation of named groups, so detection is a single match call
+_DETECT = re.compile("|".join(
+    f"(?P<{validator.API_NAME}>{validator.FORMAT_REGEX.pattern})" for validator in DETECTION_ORDER
+))
+
+
+def detect_provider(key):
+    """Return the API type whose key format matches key, or None"""
+    match = _DETECT.match(key)
+    return match.lastgroup if match else None
@@ -1,56 +1,187 @@
 """
 API Key Checker Web Application
-Flask-based web interface for validating API keys
+Quart-based (async Flask API) web interface for validating API keys
 """
 
-from flask import Flask, render_template, request, jsonify
+from quart import Quart, Response, render_template, request, jsonify
+import asyncio
+import functools
+import hashlib
 import json
-from api_validators import (
-    OpenAIValidator,
-    GitHubValidator,
-    GoogleValidator,
-    AWSValidator,
-    HuggingFaceValidator,
-    ClaudeValidator,
-    GeminiValidator,
-    GrokValidator,
-    CohereValidator,
-    PerplexityValidator,
-    ReplicateValidator,
-    TogetherAIValidator,
-    AnthropicValidator,
+import threading
+import aiohttp
+import orjson
+import uvicorn
+from cachetools import TTLCache
+import config
+from known_invalid import KNOWN_INVALID_ERROR, known_invalid
+from api_validators import BaseValidator, detect_provider
+from async_validators import (
+    AsyncOpenAIValidator,
+    AsyncGitHubValidator,
+    AsyncGoogleValidator,
+    AsyncAWSValidator,
+    AsyncHuggingFaceValidator,
+    AsyncClaudeValidator,
+    AsyncGeminiValidator,
+    AsyncGrokValidator,
+    AsyncCohereValidator,
+    AsyncPerplexityValidator,
+    AsyncReplicateValidator,
+    AsyncTogetherAIValidator,
 )
 
-app = Flask(__name__)
-app.config['JSON_SORT_KEYS'] = False
+app = Quart(__name__)
+app.json.sort_keys = False
 
 # Initialize validators
 validators = {
-    "openai": OpenAIValidator(),
-    "github": GitHubValidator(),
-    "google": GoogleValidator(),
-    "aws": AWSValidator(),
-    "huggingface": HuggingFaceValidator(),
-    "claude": ClaudeValidator(),
-    "gemini": GeminiValidator(),
-    "grok": GrokValidator(),
-    "cohere": CohereValidator(),
-    "perplexity": PerplexityValidator(),
-    "replicate": ReplicateValidator(),
-    "togetherai": TogetherAIValidator(),
+    "openai": AsyncOpenAIValidator(),
+    "github": AsyncGitHubValidator(),
+    "google": AsyncGoogleValidator(),
+    "aws": AsyncAWSValidator(),
+    "huggingface": AsyncHuggingFaceValidator(),
+    "claude": AsyncClaudeValidator(),
+    "gemini": AsyncGeminiValidator(),
+    "grok": AsyncGrokValidator(),
+    "cohere": AsyncCohereValidator(),
+    "perplexity": AsyncPerplexityValidator(),
+    "replicate": AsyncReplicateValidator(),
+    "togetherai": AsyncTogetherAIValidator(),
 }
 
+# Recently confirmed-active keys, stored by SHA-256 so raw secrets are never retained
+_active_cache = TTLCache(maxsize=config.CACHE_MAXSIZE, ttl=config.CACHE_TTL)
+_active_cache_lock = threading.Lock()
+
+
+def _cache_key(api_type, key):
+    """Cache key for a validation result"""
+    return api_type, hashlib.sha256(key.encode()).hexdigest()
+
+
+def _remember(cache_key, outcome):
+    """Cache a test_key outcome if it was successful"""
+    if outcome[0]:
+        with _active_cache_lock:
+            _active_cache[cache_key] = outcome
+
+
+async def _cached_test_key(api_type, key):
+    """Test a key, skipping the network if its outcome is already known"""
+    cache_key = _cache_key(api_type, key)
+    with _active_cache_lock:
+        cached = _active_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    if known_invalid.contains(api_type, key):
+        return False, KNOWN_INVALID_ERROR
+
+    # Wait for a free connection slot first, so the request timeout never
+    # counts time spent queued behind the rest of a large batch
+    async with app.check_slots[api_type]:
+        outcome = await validators[api_type].test_key_async(app.http_session, key)
+    _remember(cache_key, outcome)
+    return outcome
+
+
+def _json_response(payload):
+    """Serialize a (potentially large) JSON payload with orjson"""
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+
+def _new_result(api_type, key, format_valid):
+    """Build the result entry for a key before it is tested"""
+    return {
+        'api_type': api_type,
+        'key_preview': key[:10] + '***' if len(key) > 10 else '***',
+        'format_valid': format_valid,
+        'is_active': False,
+        'status': 'Invalid format',
+        'error': None,
+    }
+
+
+def _apply_outcome(result, is_active, error):
+    """Record a test_key outcome on a result entry"""
+    result['is_active'] = is_active
+    result['error'] = error
+    if is_active:
+        result['status'] = 'Valid and Active ✅'
+    else:
+        result['status'] = f'Invalid/Inactive - {error}'
+
+
+async def _test_pending(pending):
+    """Test (api_type, key, result) entries concurrently"""
+    outcomes = await asyncio.gather(
+        *(_cached_test_key(api_type, key) for api_type, key, _ in pending)
+    )
+
+    for (_, _, result), (is_active, error) in zip(pending, outcomes):
+        _apply_outcome(result, is_active, error)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_batch_fn(api_type):
+    """Build a batch validator specialised for one API type"""
+    # Bind per-type lookups once so the per-key loop only touches locals
+    _vf = validators[api_type].validate_format
+    _template = _new_result(api_type, '', False)
+
+    async def validate_batch(keys):
+        """Validate distinct stripped keys, returning their result entries by key"""
+        results_by_key = {}
+        pending = []
+        for key in keys:
+            result = _template.copy()
+            if len(key) > 10:
+                result['key_preview'] = key[:10] + '***'
+            if _vf(key):
+                result['format_valid'] = True
+                pending.append((api_type, key, result))
+            results_by_key[key] = result
+
+        await _test_pending(pending)
+        return results_by_key
+
+    return validate_batch
+
+
+@app.before_serving
+async def open_http_session():
+    """Open the aiohttp session shared by every request for the app's lifetime"""
+    # The connector pools per host, so keys for one provider reuse keep-alive connections;
+    # the default headers match the static headers the sync validators send
+    app.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=config.HTTP_CONNECTION_LIMIT, limit_per_host=config.HTTP_CONNECTIONS_PER_HOST),
+        headers=BaseValidator.SESSION_HEADERS,
+    )
+    # One slot per pooled connection, per provider
+    app.check_slots = {
+        api_type: asyncio.Semaphore(config.HTTP_CONNECTIONS_PER_HOST) for api_type in validators
+    }
+
+
+@app.after_serving
+async def close_http_session():
+    """Close the shared aiohttp session"""
+    await app.http_session.close()
+
 
 @app.route('/')
-def index():
+async def index():
     """Home page"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 
 @app.route('/api/validate', methods=['POST'])
-def validate_key():
+async def validate_key():
     """API endpoint to validate a single key"""
-    data = request.json
+    data = await request.get_json()
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
     api_type = data.get('api_type', '').lower()
     key = data.get('key', '').strip()
 
@@ -67,34 +198,23 @@ def validate_key():
     # Validate format
     format_valid = validator.validate_format(key)
 
-    result = {
-        'api_type': api_type,
-        'key_preview': key[:10] + '***' if len(key) > 10 else '***',
-        'format_valid': format_valid,
-        'is_active': False,
-        'status': 'Invalid format',
-        'error': None,
-    }
+    result = _new_result(api_type, key, format_valid)
 
     if format_valid:
         # Test if key is active
-        is_active, error = validator.test_key(key)
-        result['is_active'] = is_active
-        result['error'] = error
-        if is_active:
-            result['status'] = 'Valid and Active ✅'
-        else:
-            result['status'] = f'Invalid/Inactive - {error}'
-    else:
-        result['status'] = 'Invalid format'
+        is_active, error = await _cached_test_key(api_type, key)
+        _apply_outcome(result, is_active, error)
 
     return jsonify(result)
 
 
 @app.route('/api/batch-validate', methods=['POST'])
-def batch_validate():
+async def batch_validate():
     """API endpoint to validate multiple keys"""
-    data = request.json
+    data = await request.get_json()
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
     api_type = data.get('api_type', '').lower()
     keys = data.get('keys', [])
 
@@ -106,38 +226,90 @@ def batch_validate():
             'error': f'Unknown API type. Supported: {", ".join(validators.keys())}'
         }), 400
 
+    keys = [key for key in map(str.strip, keys) if key]
+
+    # Validate each distinct key once, then report it for every occurrence
+    results_by_key = await _make_batch_fn(api_type)(dict.fromkeys(keys))
+    return _json_response({'results': [results_by_key[key] for key in keys]})
+
+
+@app.route('/api/multi-validate', methods=['POST'])
+async def multi_validate():
+    """API endpoint to validate keys for several API types (or auto-detected ones) in one request"""
+    data = await request.get_json()
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    items = data.get('items', [])
+
+    if not items or not isinstance(items, list):
+        return jsonify({'error': 'Missing items'}), 400
+
     results = []
-    for key in keys:
-        if key.strip():
-            # Make a request to the single validate endpoint
-            validator = validators[api_type]
-
-            format_valid = validator.validate_format(key.strip())
-            result = {
-                'api_type': api_type,
-                'key_preview': key.strip()[:10] + '***' if len(key.strip()) > 10 else '***',
-                'format_valid': format_valid,
-                'is_active': False,
-                'status': 'Invalid format',
-                'error': None,
-            }
-
-            if format_valid:
-                is_active, error = validator.test_key(key.strip())
-                result['is_active'] = is_active
-                result['error'] = error
-                if is_active:
-                    result['status'] = 'Valid and Active ✅'
-                else:
-                    result['status'] = f'Invalid/Inactive - {error}'
-
-            results.append(result)
-
-    return jsonify({'results': results})
+    for item in items:
+        if not isinstance(item, dict):
+            return jsonify({'error': 'Each item must be an object with a key'}), 400
+
+        api_type = item.get('api_type') or 'auto'
+        key = item.get('key') or ''
+        if not isinstance(api_type, str) or not isinstance(key, str):
+            return jsonify({'error': 'api_type and key must be strings'}), 400
+
+        api_type = api_type.lower()
+        key = key.strip()
+        if not key:
+            return jsonify({'error': 'Each item needs a key'}), 400
+
+        if api_type == 'auto':
+            # Undetectable keys are reported as badly formatted
+            api_type = detect_provider(key)
+            if api_type is None:
+                results.append(('unknown', key, _new_result('unknown', key, False)))
+                continue
+
+        if api_type not in validators:
+            return jsonify({
+                'error': f'Unknown API type: {api_type}. Supported: {", ".join(validators.keys())}'
+            }), 400
+
+        format_valid = validators[api_type].validate_format(key)
+        results.append((api_type, key, _new_result(api_type, key, format_valid)))
+
+    # Different providers never share connections, so every check runs at once
+    await _test_pending([entry for entry in results if entry[2]['format_valid']])
+
+    return _json_response({'results': [result for _, _, result in results]})
+
+
+@app.route('/api/invalidate', methods=['POST'])
+async def invalidate():
+    """API endpoint to evict cached results (one key, or everything if no key given)
+
+    The cache is per process, so with several server workers this only clears the one handling the request.
+    """
+    data = await request.get_json()
+    if data is None and not await request.get_data():
+        data = {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    api_type = data.get('api_type', '').lower()
+    key = data.get('key', '').strip()
+
+    with _active_cache_lock:
+        if not key:
+            evicted = len(_active_cache)
+            _active_cache.clear()
+        elif not api_type:
+            return jsonify({'error': 'Missing api_type'}), 400
+        else:
+            evicted = 1 if _active_cache.pop(_cache_key(api_type, key), None) else 0
+
+    return jsonify({'evicted': evicted})
 
 
 @app.route('/api/supported-apis', methods=['GET'])
-def supported_apis():
+async def supported_apis():
     """Get list of supported API types"""
     return jsonify({
         'apis': [
@@ -158,4 +330,5 @@ def supported_apis():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # One worker: the result cache lives in process memory, and /api/invalidate must reach it
+    uvicorn.run('app:app', host='0.0.0.0', port=5000, loop='auto')
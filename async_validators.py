@@ -0,0 +1,345 @@
+"""
+Async API validators used by the web app
+Each class adds an aiohttp-based test_key_async to its synchronous validator
+"""
+
+import asyncio
+import aiohttp
+import orjson
+from api_validators import (
+    OpenAIValidator,
+    GitHubValidator,
+    GoogleValidator,
+    AWSValidator,
+    HuggingFaceValidator,
+    ClaudeValidator,
+    GeminiValidator,
+    GrokValidator,
+    CohereValidator,
+    PerplexityValidator,
+    ReplicateValidator,
+    TogetherAIValidator,
+    AnthropicValidator,
+)
+
+
+class AsyncValidatorMixin:
+    """Adds async key testing over a shared aiohttp.ClientSession to a validator"""
+
+    def __init__(self):
+        super().__init__()
+        connect_timeout, read_timeout = self._timeout
+        self._aio_timeout = aiohttp.ClientTimeout(
+            total=connect_timeout + read_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+
+    async def _head_or_get_async(self, session, url, **kwargs):
+        """Async variant of _head_or_get, returning only the status code"""
+        async with session.head(url, allow_redirects=True, **kwargs) as response:
+            if response.status in self.HEAD_CONCLUSIVE_STATUSES:
+                return response.status
+        async with session.get(url, **kwargs) as response:
+            return response.status
+
+    async def test_key_async(self, session, key):
+        """Async variant of test_key
+
+        Validators that talk plain HTTPS override this; the default runs the
+        blocking test_key in a worker thread so it never stalls the event loop.
+        """
+        return await asyncio.to_thread(self.test_key, key)
+
+
+class AsyncOpenAIValidator(AsyncValidatorMixin, OpenAIValidator):
+    """Async validator for OpenAI API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            status = await self._head_or_get_async(
+                session,
+                "https://api.openai.com/v1/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            )
+            if status == 200:
+                return True, None
+            elif status == 401:
+                return self._unauthorized(key, "Unauthorized - invalid key")
+            else:
+                return False, f"HTTP {status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncGitHubValidator(AsyncValidatorMixin, GitHubValidator):
+    """Async validator for GitHub Personal Access Tokens"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"token {key}"}
+            async with session.get(
+                "https://api.github.com/user",
+                headers=headers,
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 401:
+                    return self._unauthorized(key, "Unauthorized - invalid token")
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncGoogleValidator(AsyncValidatorMixin, GoogleValidator):
+    """Async validator for Google API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            # Test with Google Geocoding API (free tier)
+            async with session.get(
+                "https://maps.googleapis.com/maps/api/geocode/json",
+                params={"address": "1600 Amphitheatre Parkway, Mountain View, CA", "key": key},
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status != 200:
+                    return False, f"HTTP {response.status}"
+
+                # Successful responses never contain error_message, so skip parsing them
+                raw = await response.read()
+                if b'"error_message"' not in raw:
+                    return True, None
+
+                data = orjson.loads(raw)
+                if "error_message" not in data:
+                    return True, None
+                else:
+                    return False, data.get("error_message", "API returned error")
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            return False, str(e)
+
+
+class AsyncAWSValidator(AsyncValidatorMixin, AWSValidator):
+    """Async validator for AWS Access Keys"""
+
+
+class AsyncHuggingFaceValidator(AsyncValidatorMixin, HuggingFaceValidator):
+    """Async validator for Hugging Face API tokens"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            status = await self._head_or_get_async(
+                session,
+                "https://huggingface.co/api/whoami",
+                headers=headers,
+                timeout=self._aio_timeout,
+            )
+            if status == 200:
+                return True, None
+            elif status == 401:
+                return self._unauthorized(key, "Unauthorized - invalid token")
+            else:
+                return False, f"HTTP {status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncClaudeValidator(AsyncValidatorMixin, ClaudeValidator):
+    """Async validator for Claude (Anthropic) API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {**self.SESSION_HEADERS, "x-api-key": key}
+            async with session.get(
+                "https://api.anthropic.com/v1/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 401:
+                    return self._unauthorized(key, "Unauthorized - invalid API key")
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncGeminiValidator(AsyncValidatorMixin, GeminiValidator):
+    """Async validator for Google Gemini API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            async with session.get(
+                "https://generativelanguage.googleapis.com/v1beta/models",
+                params={"key": key},
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 400:
+                    return False, "Invalid API key format"
+                elif response.status == 403:
+                    return False, "Forbidden - API not enabled or key invalid"
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncGrokValidator(AsyncValidatorMixin, GrokValidator):
+    """Async validator for Grok (xAI) API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            status = await self._head_or_get_async(
+                session,
+                "https://api.x.ai/v1/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            )
+            if status == 200:
+                return True, None
+            elif status == 401:
+                return self._unauthorized(key, "Unauthorized - invalid API key")
+            else:
+                return False, f"HTTP {status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncCohereValidator(AsyncValidatorMixin, CohereValidator):
+    """Async validator for Cohere API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            async with session.post(
+                "https://api.cohere.com/v1/check-api-key",
+                headers=headers,
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 401:
+                    return self._unauthorized(key, "Unauthorized - invalid API key")
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncPerplexityValidator(AsyncValidatorMixin, PerplexityValidator):
+    """Async validator for Perplexity API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            status = await self._head_or_get_async(
+                session,
+                "https://api.perplexity.ai/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            )
+            if status == 200:
+                return True, None
+            elif status == 401:
+                return self._unauthorized(key, "Unauthorized - invalid API key")
+            else:
+                return False, f"HTTP {status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncReplicateValidator(AsyncValidatorMixin, ReplicateValidator):
+    """Async validator for Replicate API tokens"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Token {key}"}
+            async with session.get(
+                "https://api.replicate.com/v1/account",
+                headers=headers,
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 401:
+                    return self._unauthorized(key, "Unauthorized - invalid token")
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncTogetherAIValidator(AsyncValidatorMixin, TogetherAIValidator):
+    """Async validator for Together AI API keys"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {"Authorization": f"Bearer {key}"}
+            status = await self._head_or_get_async(
+                session,
+                "https://api.together.xyz/v1/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            )
+            if status == 200:
+                return True, None
+            elif status == 401:
+                return self._unauthorized(key, "Unauthorized - invalid API key")
+            else:
+                return False, f"HTTP {status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
+
+
+class AsyncAnthropicValidator(AsyncValidatorMixin, AnthropicValidator):
+    """Async validator for Anthropic API keys (alternative format)"""
+
+    async def test_key_async(self, session, key):
+        try:
+            headers = {**self.SESSION_HEADERS, "x-api-key": key}
+            async with session.get(
+                "https://api.anthropic.com/v1/models",
+                headers=headers,
+                timeout=self._aio_timeout,
+            ) as response:
+                if response.status == 200:
+                    return True, None
+                elif response.status == 401:
+                    return self._unauthorized(key, "Unauthorized - invalid API key")
+                else:
+                    return False, f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            return False, "Request timed out"
+        except aiohttp.ClientError as e:
+            return False, str(e)
@@ -1,8 +1,28 @@
 # API Key Checker Configuration
 # Add your API configuration here
 
-# Timeout for API calls (in seconds)
-API_TIMEOUT = 5
+# Timeout for establishing a connection to an API (in seconds)
+API_CONNECT_TIMEOUT = 1.5
+
+# Default read timeout for API calls (in seconds)
+API_TIMEOUT = 3
+
+# Per-provider read timeouts (in seconds), roughly 3x each provider's P99
+API_TIMEOUTS = {
+    "openai": 3,
+    "github": 2,
+    "google": 2,
+    "aws": 3,
+    "huggingface": 3,
+    "claude": 3,
+    "anthropic": 3,
+    "gemini": 2,
+    "grok": 3,
+    "cohere": 2,
+    "perplexity": 3,
+    "replicate": 2,
+    "togetherai": 3,
+}
 
 # Enable verbose output
 VERBOSE = False
@@ -10,5 +30,27 @@ VERBOSE = False
 # Batch size for processing
 BATCH_SIZE = 10
 
+# Worker threads used to test keys concurrently from the CLI
+MAX_WORKERS = 32
+
+# Open connections the web app keeps in total, and to any one provider
+HTTP_CONNECTION_LIMIT = 128
+HTTP_CONNECTIONS_PER_HOST = 32
+
 # Rate limiting between requests (in seconds)
 RATE_LIMIT_DELAY = 0.5
+
+# How long a successful validation is remembered (in seconds)
+CACHE_TTL = 30
+
+# Maximum number of remembered validations
+CACHE_MAXSIZE = 10_000
+
+# File holding hashes of keys recently rejected as unauthorized
+KNOWN_INVALID_PATH = ".known_invalid.pickle"
+
+# How long rejected keys are remembered (in seconds)
+KNOWN_INVALID_MAX_AGE = 24 * 60 * 60
+
+# How often newly rejected keys are merged into the file on disk (in seconds)
+KNOWN_INVALID_SAVE_INTERVAL = 60
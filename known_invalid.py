@@ -0,0 +1,153 @@
+"""
+Persistent Bloom filter of keys recently rejected as unauthorized
+Lets repeated scans skip the network for keys already known to be invalid
+"""
+
+import atexit
+import hashlib
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from pybloom_live import ScalableBloomFilter
+import config
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; saves there are not locked across processes
+    fcntl = None
+
+KNOWN_INVALID_ERROR = "Unauthorized - recently rejected (cached)"
+
+
+class KnownInvalidFilter:
+    """Bloom filter of SHA-256 key hashes, persisted to disk and reset once it expires
+
+    Several processes (e.g. uvicorn workers) can share one file: each save merges the
+    entries added since the last save into the on-disk filter under a file lock, then
+    adopts the merged result, so entries from other processes are picked up as well.
+    """
+
+    def __init__(self, path, max_age, save_interval):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.save_interval = save_interval
+        # Guards the in-memory filter; never held during file I/O
+        self._lock = threading.Lock()
+        # Serialises saves, which may run on a background thread
+        self._save_lock = threading.Lock()
+        # Hashes added since the last save, waiting to be merged into the file
+        self._pending = set()
+        self._last_save = time.time()
+        self._saving = False
+        self._filter, self._created = self._load()
+
+    @staticmethod
+    def _new_filter():
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+
+    @staticmethod
+    def _hash(api_type, key):
+        # Scoped to the provider: a key rejected by one API says nothing about another
+        return hashlib.sha256(f"{api_type}:{key}".encode()).digest()
+
+    def _load(self):
+        """Load the filter from disk, starting fresh if it is missing, unreadable or expired"""
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            if time.time() - state["created"] < self.max_age:
+                return state["filter"], state["created"]
+        except Exception:  # Missing, corrupt or written by an incompatible version
+            pass
+        return self._new_filter(), time.time()
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an exclusive lock shared by every process using this filter file"""
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _expire(self):
+        """Drop every entry once the filter is older than max_age (caller holds the lock)"""
+        if time.time() - self._created >= self.max_age:
+            self._filter, self._created = self._new_filter(), time.time()
+            self._pending.clear()
+
+    def contains(self, api_type, key):
+        """Check whether api_type recently rejected key as unauthorized"""
+        with self._lock:
+            self._expire()
+            return self._hash(api_type, key) in self._filter
+
+    def add(self, api_type, key):
+        """Record a key that api_type rejected as unauthorized"""
+        with self._lock:
+            self._expire()
+            digest = self._hash(api_type, key)
+            self._filter.add(digest)
+            self._pending.add(digest)
+            due = not self._saving and time.time() - self._last_save >= self.save_interval
+            if due:
+                self._saving = True
+        if due:
+            # Save on a background thread so callers (e.g. the web app's event loop)
+            # never wait on the file lock or pickling
+            threading.Thread(target=self._background_save, daemon=True).start()
+
+    def _background_save(self):
+        """Run a periodic save and allow the next one to be scheduled"""
+        try:
+            self.save()
+        finally:
+            with self._lock:
+                self._saving = False
+
+    def save(self):
+        """Merge entries added since the last save into the file on disk"""
+        with self._save_lock:
+            with self._lock:
+                pending, self._pending = self._pending, set()
+                self._last_save = time.time()
+            if not pending:
+                return
+
+            try:
+                with self._file_lock():
+                    merged, created = self._load()
+                    for digest in pending:
+                        merged.add(digest)
+
+                    # Write to a temporary file first so readers never see a partial pickle
+                    tmp_path = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+                    with open(tmp_path, "wb") as f:
+                        pickle.dump({"created": created, "filter": merged}, f)
+                    os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"❌ Could not save known-invalid filter: {e}")
+                with self._lock:
+                    # Keep the entries so the next save retries them
+                    self._pending |= pending
+                return
+
+            with self._lock:
+                # Keys added while the file was being written are merged on the next save
+                for digest in self._pending:
+                    merged.add(digest)
+                self._filter, self._created = merged, created
+
+
+known_invalid = KnownInvalidFilter(
+    Path(__file__).parent / config.KNOWN_INVALID_PATH,
+    config.KNOWN_INVALID_MAX_AGE,
+    config.KNOWN_INVALID_SAVE_INTERVAL,
+)
+atexit.register(known_invalid.save)
@@ -7,7 +7,10 @@ Supports batch processing and detailed validation reports
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import config
+from known_invalid import KNOWN_INVALID_ERROR, known_invalid
 from api_validators import (
     OpenAIValidator,
     GitHubValidator,
@@ -18,16 +21,22 @@ from api_validators import (
 from utils import load_keys_from_file, print_report
 
 
+# Live key checks are network-bound; requests releases the GIL while waiting
+_EXECUTOR = ThreadPoolExecutor(max_workers=config.MAX_WORKERS)
+
+# Validators hold pooled HTTP sessions, so build them once per process
+VALIDATORS = {
+    "openai": OpenAIValidator(),
+    "github": GitHubValidator(),
+    "google": GoogleValidator(),
+    "aws": AWSValidator(),
+    "huggingface": HuggingFaceValidator(),
+}
+
+
 def get_validator(api_type):
     """Return validator instance for the given API type"""
-    validators = {
-        "openai": OpenAIValidator(),
-        "github": GitHubValidator(),
-        "google": GoogleValidator(),
-        "aws": AWSValidator(),
-        "huggingface": HuggingFaceValidator(),
-    }
-    return validators.get(api_type.lower())
+    return VALIDATORS.get(api_type.lower())
 
 
 def validate_single_key(key, api_type):
@@ -49,7 +58,10 @@ def validate_single_key(key, api_type):
     }
 
     if result["format_valid"]:
-        is_active, error = validator.test_key(key)
+        if known_invalid.contains(validator.API_NAME, key):
+            is_active, error = False, KNOWN_INVALID_ERROR
+        else:
+            is_active, error = validator.test_key(key)
         result["is_active"] = is_active
         result["error"] = error
         if is_active:
@@ -73,11 +85,10 @@ def validate_batch_keys(keys_data, api_type):
     else:
         keys = [keys_data]
 
-    for key in keys:
-        if key.strip():
-            result = validate_single_key(key.strip(), api_type)
-            if result:
-                results.append(result)
+    keys = [key for key in map(str.strip, keys) if key]
+    for result in _EXECUTOR.map(lambda key: validate_single_key(key, api_type), keys):
+        if result:
+            results.append(result)
 
     return results
 
@@ -2,21 +2,46 @@
 Utility functions for API Key Checker
 """
 
+import unicodedata
 from pathlib import Path
-from tabulate import tabulate
 
 
 def load_keys_from_file(filepath):
     """Load API keys from a text file (one per line)"""
     try:
         with open(filepath, "r") as f:
-            keys = [line.strip() for line in f if line.strip()]
+            keys = [line for line in map(str.strip, f) if line]
         return keys
     except FileNotFoundError:
         print(f"❌ File not found: {filepath}")
         return []
 
 
+def _display_width(text):
+    """Terminal column width of text (wide characters such as emoji take two)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+def format_grid(headers, rows):
+    """Render rows as a grid table, with a double rule under the header"""
+    widths = [_display_width(header) for header in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], _display_width(cell))
+
+    def rule(char):
+        return "+" + "+".join(char * (w + 2) for w in widths) + "+"
+
+    def line(cells):
+        return "| " + " | ".join(cell + " " * (w - _display_width(cell)) for cell, w in zip(cells, widths)) + " |"
+
+    lines = [rule("-"), line(headers), rule("=")]
+    for row in rows:
+        lines.append(line(row))
+        lines.append(rule("-"))
+    return "\n".join(lines)
+
+
 def print_report(results):
     """Print validation results in a formatted table"""
     if not results:
@@ -36,7 +61,7 @@ def print_report(results):
         ])
 
     headers = ["Status", "API Type", "Key Preview", "Format", "Details"]
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    print(format_grid(headers, table_data))
 
     # Summary
     valid_count = sum(1 for r in results if r["is_active"])